@@ -0,0 +1,123 @@
+#Provides adapters that let connection handlers run on asyncio transports instead of sockets registered with a selector. This is used by the asyncio server engine.
+
+import selectors
+import asyncio
+import traceback
+
+class TransportSocket:
+    def __init__(self, transport: asyncio.Transport):
+        """
+            Presents an asyncio transport through the part of the socket interface used by MessageSender and MessageReceiver
+            transport: the transport for the connection
+        """
+        self.transport = transport
+        self.received_data = bytearray()
+        self.has_peer_closed = False
+
+    def feed_data(self, data):
+        """Stores data received by the transport until the message receiver reads it"""
+        self.received_data += data
+
+    def feed_eof(self):
+        """Records that the peer closed its side of the connection"""
+        self.has_peer_closed = True
+
+    def has_received_data(self):
+        """Returns true if there is data or a connection closing waiting to be read"""
+        return len(self.received_data) > 0 or self.has_peer_closed
+
+    def recv(self, amount_of_bytes_to_receive: int):
+        """Returns at most the specified amount of received bytes. Returns empty bytes once the peer has closed and everything has been read."""
+        if not self.received_data:
+            if self.has_peer_closed:
+                return b""
+            raise BlockingIOError()
+        result = bytes(self.received_data[:amount_of_bytes_to_receive])
+        del self.received_data[:amount_of_bytes_to_receive]
+        return result
+
+    def send(self, data):
+        """Hands the data to the transport, which buffers whatever cannot be written immediately"""
+        if not self.transport.is_closing():
+            self.transport.write(data)
+        return len(data)
+
+    def close(self):
+        self.transport.close()
+
+class TransportSelector:
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        """
+            Stands in for the selector that connection handlers register with.
+            When a handler asks to be notified about writability, its pending bytes are flushed into the transport on the next event loop iteration.
+            This way, all of the responses produced while handling one batch of received data are written together.
+            loop: the event loop running the connections
+        """
+        self.loop = loop
+        self.handlers_waiting_to_write = {}
+        self.has_scheduled_flush = False
+
+    def modify(self, sock, mode, data):
+        if mode & selectors.EVENT_WRITE:
+            self.handlers_waiting_to_write[data] = None
+            if not self.has_scheduled_flush:
+                self.has_scheduled_flush = True
+                self.loop.call_soon(self._flush)
+
+    def unregister(self, sock):
+        pass
+
+    def _flush(self):
+        """Writes the pending bytes of every handler that asked to write since the last flush"""
+        self.has_scheduled_flush = False
+        handlers = self.handlers_waiting_to_write
+        self.handlers_waiting_to_write = {}
+        for handler in handlers:
+            if handler.connection_information.sock is not None:
+                handler.process_events(selectors.EVENT_WRITE)
+
+class ConnectionHandlerProtocol(asyncio.Protocol):
+    def __init__(self, selector: TransportSelector, logger, create_connection_handler):
+        """
+            Drives a connection handler from asyncio protocol callbacks
+            selector: the transport selector shared by the connections on the event loop
+            logger: the logger used to record errors
+            create_connection_handler: a function taking the selector, socket, and address for the connection that creates its connection handler
+        """
+        self.selector = selector
+        self.logger = logger
+        self.create_connection_handler = create_connection_handler
+        self.sock = None
+        self.handler = None
+
+    def connection_made(self, transport):
+        self.sock = TransportSocket(transport)
+        address = transport.get_extra_info('peername')[:2]
+        self.handler = self.create_connection_handler(self.selector, self.sock, address)
+
+    def data_received(self, data):
+        self.sock.feed_data(data)
+        self._process_received_data()
+
+    def eof_received(self):
+        self.sock.feed_eof()
+        self._process_received_data()
+        return False
+
+    def connection_lost(self, exc):
+        if self._is_handler_open():
+            self.handler.close()
+
+    def _is_handler_open(self):
+        return self.handler is not None and self.handler.connection_information.sock is not None
+
+    def _process_received_data(self):
+        """Lets the connection handler read until all of the received data has been consumed"""
+        try:
+            while self._is_handler_open() and self.sock.has_received_data():
+                self.handler.process_events(selectors.EVENT_READ)
+        except Exception:
+            self.logger.log_message(
+                f"main: error: exception for {self.handler.connection_information.addr}:\n{traceback.format_exc()}",
+            )
+            self.handler.close()
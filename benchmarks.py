@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+
+#Benchmarks for measuring the performance of the server and its supporting code. Run 'python benchmarks.py -h' to see the available benchmarks.
+
+import sys
+import time
+import selectors
+import argparse
+from threading import Thread
+
+import protocol_definitions
+import connection_handler
+from protocol import Message
+from client import Client, create_socket_from_address
+from server import SERVER_ENGINES
+from logging_utilities import PrimaryMemoryLogger
+from database_management import create_database_at_path
+
+BENCHMARK_HOST = 'localhost'
+BENCHMARK_DATABASE_PATH = 'benchmark.db'
+
+#Utility code
+
+def wait_until_true(condition_function, time_to_wait=60, waiting_time=0.001):
+    """Sleeps until the condition function returns true. Raises a TimeoutError if that takes longer than the time to wait in seconds."""
+    starting_time = time.perf_counter()
+    while not condition_function():
+        if time.perf_counter() - starting_time > time_to_wait:
+            raise TimeoutError(f"Benchmark timed out after {time_to_wait} seconds!")
+        time.sleep(waiting_time)
+
+def report(name, value, unit):
+    print(f"{name}: {value:,.1f} {unit}")
+
+class BenchmarkServer:
+    def __init__(self, engine: str, database_path=BENCHMARK_DATABASE_PATH):
+        """
+            Runs a server with the specified engine on a loopback port in a background thread
+            engine: the name of the server engine
+            database_path: the path to the database used by the server
+        """
+        create_database_at_path(database_path)
+        self.logger = PrimaryMemoryLogger()
+        self.server = SERVER_ENGINES[engine](BENCHMARK_HOST, 0, self.logger, database_path)
+        self.port = self.server.listening_socket.getsockname()[1]
+        self.thread = Thread(target=self.server.listen_for_socket_events)
+        self.thread.start()
+
+    def close(self):
+        """Asks the server to close. The thread is joined separately because a selector server only notices after its next event."""
+        self.server.close()
+
+    def join(self):
+        self.thread.join()
+
+class BenchmarkClient:
+    def __init__(self, port: int):
+        """
+            Runs a client connected to a benchmark server on a loopback port in a background thread once started.
+            Messages should be sent before starting the client because sending from another thread while the client is writing is not safe.
+            port: the port of the server
+        """
+        self.logger = PrimaryMemoryLogger()
+        self.client = Client(
+            BENCHMARK_HOST,
+            port,
+            selectors.DefaultSelector(),
+            self.logger,
+            output_text_function=lambda text: None,
+            socket_creation_function=create_socket_from_address,
+            should_reconnect=False
+        )
+        self.thread = Thread(target=self.client.run_selector_loop)
+
+    def start(self):
+        self.thread.start()
+
+    def compute_number_of_received_messages(self):
+        return len(self.logger.get_log(connection_handler.RECEIVING_MESSAGE_LOG_CATEGORY))
+
+    def send_message(self, message: Message):
+        self.client.send_message(message)
+
+    def close(self):
+        self.client.close()
+        self.thread.join()
+
+def close_benchmark_server_and_clients(server: BenchmarkServer, clients):
+    """Closes the server before the clients so that the disconnections wake the server up to notice that it should close"""
+    server.close()
+    for client in clients:
+        client.close()
+    server.join()
+
+#Benchmark definitions
+
+def benchmark_server_engines(number_of_clients=20, requests_per_client=500):
+    """Compares the request and response throughput of the server engines"""
+    #A quit request from a player outside of a game is answered with a single text message without touching the database
+    request = Message(protocol_definitions.QUIT_GAME_PROTOCOL_TYPE_CODE)
+    for engine in SERVER_ENGINES:
+        server = BenchmarkServer(engine)
+        clients = [BenchmarkClient(server.port) for _ in range(number_of_clients)]
+        starting_time = time.perf_counter()
+        for client in clients:
+            for _ in range(requests_per_client):
+                client.send_message(request)
+            client.start()
+        for client in clients:
+            wait_until_true(lambda: client.compute_number_of_received_messages() >= requests_per_client)
+        elapsed_time = time.perf_counter() - starting_time
+        close_benchmark_server_and_clients(server, clients)
+        total_messages = 2*number_of_clients*requests_per_client
+        report(f"{engine} engine", total_messages/elapsed_time, "messages/second")
+
+BENCHMARKS = {
+    'engines': benchmark_server_engines,
+}
+
+def main():
+    """The entry point for running benchmarks"""
+    parser = argparse.ArgumentParser(prog='benchmarks.py', description='Runs performance benchmarks.', usage=f"usage: {sys.argv[0]} [<benchmark> ...]")
+    parser.add_argument("benchmarks", nargs="*", help=f"The benchmarks to run out of {', '.join(BENCHMARKS)}. All of them are run if none are given.")
+    arguments = parser.parse_args()
+    names = arguments.benchmarks or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            parser.error(f"{name} is not a benchmark!")
+    for name in names:
+        print(f"Running the {name} benchmark...")
+        BENCHMARKS[name]()
+
+if __name__ == '__main__':
+    main()
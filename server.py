@@ -9,12 +9,14 @@ import selectors
 import traceback
 import os
 import argparse
+import asyncio
 
 import protocol
 from protocol import Message
 import protocol_definitions
 import logging_utilities
 import connection_handler
+import asyncio_engine
 from game_manager import GameHandler, Game
 from connection_table import ConnectionTable, ConnectionTableEntry
 from database_management import Account, create_database_at_path, retrieve_account_with_name_from_database_at_path, insert_account_into_database_at_path
@@ -57,16 +59,20 @@ class Server:
             listening_socket_creation_function: the function used to create a socket from an address, which is settable to aid with testing
         """
         self.selector = selector
+        self._initialize_request_handling(logger, database_path, listening_socket_creation_function)
+        self.listening_socket = self.create_socket_from_address((host, port))
+        self.selector.register(self.listening_socket, selectors.EVENT_READ, data=None)
+
+    def _initialize_request_handling(self, logger, database_path, listening_socket_creation_function):
+        """Sets up the state shared by every server engine for handling requests"""
         self.logger = logger
         self.database_path = database_path
         self.create_socket_from_address = listening_socket_creation_function
         self.usernames_to_connections = {}
         self.connection_table = ConnectionTable(self.usernames_to_connections)
         self.game_handler = GameHandler()
-        listening_socket = self.create_socket_from_address((host, port))
         #Define asymmetric encryption keys
         _, self.private_key = cryptography_boundary.obtain_public_private_key_pair()
-        self.selector.register(listening_socket, selectors.EVENT_READ, data=None)
         self._create_protocol_callback_handler()
         self.should_close = False
 
@@ -243,14 +249,19 @@ class Server:
         )
         return handler
 
+    def register_connection(self, selector, connection, address):
+        """Creates the connection handler for a new connection and adds it to the connection table"""
+        connection_handler = self.create_connection_handler(selector, connection, address)
+        connection_table_entry = ConnectionTableEntry(connection_handler, AssociatedConnectionState())
+        self.connection_table.insert_entry(connection_table_entry)
+        return connection_handler
+
     def accept_wrapper(self, sock):
         conn, addr = sock.accept()  # Should be ready to read
         self.logger.log_message(f"accepted connection from {addr}")
         conn.setblocking(False)
-        connection_handler = self.create_connection_handler(self.selector, conn, addr)
+        connection_handler = self.register_connection(self.selector, conn, addr)
         self.selector.register(conn, selectors.EVENT_READ, data=connection_handler)
-        connection_table_entry = ConnectionTableEntry(connection_handler, AssociatedConnectionState())
-        self.connection_table.insert_entry(connection_table_entry)
 
     def close(self):
         self.should_close = True
@@ -276,11 +287,53 @@ class Server:
         finally:
             self.selector.close()
 
+class AsyncioServer(Server):
+    #How often in seconds the event loop checks if the server was asked to close
+    CLOSING_CHECK_INTERVAL = 0.1
+    def __init__(self, host, port, logger, database_path, listening_socket_creation_function):
+        """
+            Runs the same request handling as Server on an asyncio event loop instead of a selector loop
+            host: the server's host address
+            port: the server's port number
+            logger: the logger to use for logging significant occurrences or errors
+            listening_socket_creation_function: the function used to create a socket from an address
+        """
+        self._initialize_request_handling(logger, database_path, listening_socket_creation_function)
+        self.listening_socket = self.create_socket_from_address((host, port))
+
+    def _create_connection_protocol(self, selector):
+        return asyncio_engine.ConnectionHandlerProtocol(selector, self.logger, self._register_accepted_connection)
+
+    def _register_accepted_connection(self, selector, connection, address):
+        self.logger.log_message(f"accepted connection from {address}")
+        return self.register_connection(selector, connection, address)
+
+    async def _serve(self):
+        loop = asyncio.get_running_loop()
+        selector = asyncio_engine.TransportSelector(loop)
+        asyncio_server = await loop.create_server(lambda: self._create_connection_protocol(selector), sock=self.listening_socket)
+        async with asyncio_server:
+            while not self.should_close:
+                await asyncio.sleep(self.CLOSING_CHECK_INTERVAL)
+
+    def listen_for_socket_events(self):
+        try:
+            asyncio.run(self._serve())
+        except KeyboardInterrupt:
+            print("caught keyboard interrupt, exiting")
+
+#Server engine names mapped to functions creating the server given the host, port, logger, and database path
+SERVER_ENGINES = {
+    "selectors": lambda host, port, logger, database_path: Server(host, port, selectors.DefaultSelector(), logger, database_path, create_listening_socket),
+    "asyncio": lambda host, port, logger, database_path: AsyncioServer(host, port, logger, database_path, create_listening_socket),
+}
+
 def main():
     """The entry point for the server program"""
-    parser = argparse.ArgumentParser(prog='server.py', description='The server program for hosting tictactoe games.', usage=f"usage: {sys.argv[0]} [-i <host>] -p <port>")
+    parser = argparse.ArgumentParser(prog='server.py', description='The server program for hosting tictactoe games.', usage=f"usage: {sys.argv[0]} [-i <host>] -p <port> [--engine <engine>]")
     parser.add_argument("-i", default="0.0.0.0", help="Optional argument giving the IP address to host the server on. This should only be used for testing.")
     parser.add_argument("-p", type=int, help="The port to run the server on.")
+    parser.add_argument("--engine", default="selectors", choices=list(SERVER_ENGINES), help="Optional argument choosing the event loop that runs the server. Defaults to selectors.")
     arguments = parser.parse_args()
 
     #Handle the arguments
@@ -298,13 +351,10 @@ def main():
     DATABASE_PATH = os.path.join(DATA_STORING_DIRECTORY, 'database.db')
     create_database_at_path(DATABASE_PATH)
 
-    #Create the selector
-    sel = selectors.DefaultSelector()
-
     #Initialize the server and listen for socket events
-    server = Server(host, port, sel, logger, DATABASE_PATH, create_listening_socket)
+    server = SERVER_ENGINES[arguments.engine](host, port, logger, DATABASE_PATH)
     server.listen_for_socket_events()
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
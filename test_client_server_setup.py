@@ -128,6 +128,12 @@ class TestClient(unittest.TestCase):
 
 #Integration testing
 class TestCommunication(unittest.TestCase):
+    #The server engine to test with. None runs the server on mock sockets.
+    ENGINE = None
+
+    def _create_testcase(self, **arguments):
+        return TestCase(engine=self.ENGINE, **arguments)
+
     def test_game_creation(self):
         expected_messages = [
             SkipItem(), 
@@ -135,13 +141,13 @@ class TestCommunication(unittest.TestCase):
             PLAYING_X_MESSAGE,
             EMPTY_GAME_BOARD_MESSAGE
         ]
-        testcase = TestCase(should_perform_automatic_login=True)
+        testcase = self._create_testcase(should_perform_automatic_login=True)
         testcase.buffer_client_commands("Bob", ["create Alice", 2, "join Alice"])
         testcase.run()
         testcase.assert_received_values_match_log(expected_messages, 'Bob')
         
     def test_join_and_quit(self):
-        testcase = TestCase(should_perform_automatic_login=True)
+        testcase = self._create_testcase(should_perform_automatic_login=True)
         testcase.buffer_client_commands("Bob", ["create Alice", 2, "join Alice", 4, 'quit', 5])
         testcase.buffer_client_commands("Alice", [4, 'join Bob', 6])
         testcase.run()
@@ -156,7 +162,7 @@ class TestCommunication(unittest.TestCase):
         testcase.assert_received_values_match_log(expected_alice_messages, "Alice")
 
     def test_second_player_join(self):
-        testcase = TestCase(should_perform_automatic_login=True)
+        testcase = self._create_testcase(should_perform_automatic_login=True)
         testcase.buffer_client_commands("Bob", ["create Alice", 4])
         testcase.buffer_client_commands("Alice", [2, 'join Bob', 4, 'quit'])
         expected_alice_messages = [
@@ -177,7 +183,7 @@ class TestCommunication(unittest.TestCase):
 
     def perform_gameplay_test(self, final_state, expected_first_player_outcome, expected_second_player_outcome):
         """Tests gameplay reaching the final state"""
-        testcase = TestCase(should_perform_automatic_login=True)
+        testcase = self._create_testcase(should_perform_automatic_login=True)
         bob_messages_number_before_game_starts = 5
         alice_messages_number_before_game_starts = 6
 
@@ -230,7 +236,7 @@ class TestCommunication(unittest.TestCase):
         self.perform_gameplay_test("OXXXO   O", game_utilities.LOSS, game_utilities.VICTORY)
 
     def test_absent_player_does_not_receive_moves(self):
-        testcase = TestCase(should_perform_automatic_login=True)
+        testcase = self._create_testcase(should_perform_automatic_login=True)
         testcase.buffer_client_commands("Bob", ["create Alice", 2, "join Alice", 4, 'move a1', 5])
         testcase.create_client("Alice")
         testcase.run()
@@ -238,7 +244,7 @@ class TestCommunication(unittest.TestCase):
         testcase.assert_received_values_match_log(expected_alice_messages, "Alice")
 
     def test_quitting_player_does_not_receive_moves(self):
-        testcase = TestCase(should_perform_automatic_login=True)
+        testcase = self._create_testcase(should_perform_automatic_login=True)
         testcase.buffer_client_commands("Bob", ["create Alice", 3, "join Alice", 6, 'move a1', 7, 'quit'])
         testcase.buffer_client_commands("Alice", [2, "join Bob", 5, 'quit', 6])
         testcase.run()
@@ -246,7 +252,7 @@ class TestCommunication(unittest.TestCase):
         testcase.assert_received_values_match_log(expected_alice_messages, "Alice")
 
     def test_exiting_notifies_of_leaving(self):
-        testcase = TestCase(should_perform_automatic_login=True)
+        testcase = self._create_testcase(should_perform_automatic_login=True)
         testcase.buffer_client_commands("Bob", ["create Alice", 2, "join Alice", 4, 'exit'])
         testcase.buffer_client_commands("Alice", [4, 'join Bob', 6])
         testcase.run()
@@ -254,7 +260,7 @@ class TestCommunication(unittest.TestCase):
         testcase.assert_received_values_match_log(expected_alice_messages, "Alice")
 
     def _server_handles_command_when_not_logged_in(self, command):
-        testcase = TestCase()
+        testcase = self._create_testcase()
         testcase.buffer_client_commands("Bob", [command, 1])
         testcase.run()
         expected_bob_messages = [create_must_login_message()]
@@ -265,6 +271,11 @@ class TestCommunication(unittest.TestCase):
 
     def test_server_handles_creating_when_not_logged_in(self):
         self._server_handles_command_when_not_logged_in(Message(protocol_definitions.GAME_CREATION_PROTOCOL_TYPE_CODE, 'Alice'))
+class TestSelectorsEngineCommunication(TestCommunication):
+    ENGINE = "selectors"
+
+class TestAsyncioEngineCommunication(TestCommunication):
+    ENGINE = "asyncio"
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,10 +1,11 @@
 #Add testing utilities for doing integration and client testing
 
 import time
+import selectors
 from threading import Thread
 from protocol import Message
-from client import Client
-from server import Server
+from client import Client, create_socket_from_address
+from server import Server, SERVER_ENGINES
 from database_management import insert_account_into_database_at_path_if_nonexistent, Account, create_database_at_path
 import connection_handler
 from logging_utilities import PrimaryMemoryLogger
@@ -134,9 +135,13 @@ class ReceivedMessagesLengthWaitingCommand(WaitingCommand):
         return len(relevant_log) >= self.length
 
 class TestServerHandler:
-    def __init__(self, host, port, selector, database_path, listening_socket_creation_function):
+    def __init__(self, server_creation_function):
+        """
+            Manages a server and its logger for testing
+            server_creation_function: a function that creates the server given its logger
+        """
         self.logger = PrimaryMemoryLogger()
-        self.server = Server(host, port, selector, self.logger, database_path, listening_socket_creation_function)
+        self.server = server_creation_function(self.logger)
 
     def listen_for_socket_events_without_blocking(self):
         server_listening_thread = Thread(target=self.server.listen_for_socket_events)
@@ -145,6 +150,10 @@ class TestServerHandler:
     def get_log(self, category=None):
         return self.logger.get_log(category)
 
+    def get_port(self):
+        """Returns the port that the server is actually listening on"""
+        return self.server.listening_socket.getsockname()[1]
+
     def close(self):
         self.server.close()
 
@@ -168,14 +177,42 @@ class TestingFactory:
         )
 
     def create_server(self, database_path='testing.db'):
-        return TestServerHandler(
+        return TestServerHandler(lambda logger: Server(
             self.server_host,
             self.server_port,
             MockSelector(),
+            logger,
             database_path,
             self.internet.create_listening_socket_from_address
+        ))
+
+class LoopbackTestingFactory:
+    def __init__(self, server_host, engine):
+        """
+            Creates servers and clients that communicate over real loopback sockets. This is needed for server engines that cannot run on mock sockets.
+            server_host: the host for the server
+            engine: the name of the server engine to use
+        """
+        self.server_host = server_host
+        #The port is chosen by the operating system when the server is created
+        self.server_port = 0
+        self.engine = engine
+
+    def create_client(self, credentials: Credentials=None):
+        return TestClientHandler(
+            self.server_host,
+            self.server_port,
+            selectors.DefaultSelector(),
+            create_socket_from_address,
+            credentials,
         )
 
+    def create_server(self, database_path='testing.db'):
+        create_server = SERVER_ENGINES[self.engine]
+        server_handler = TestServerHandler(lambda logger: create_server(self.server_host, 0, logger, database_path))
+        self.server_port = server_handler.get_port()
+        return server_handler
+
 def create_simple_password(username: str):
     return username + str(len(username)) + username[0]*5
 
@@ -204,14 +241,20 @@ class TestCase:
     DEFAULT_SERVER_PORT = 9090
     DEFAULT_SERVER_HOST = 'localhost'
     DEFAULT_SERVER_ADDRESS = (DEFAULT_SERVER_HOST, DEFAULT_SERVER_PORT)
-    def __init__(self, server_host=DEFAULT_SERVER_HOST, server_port=DEFAULT_SERVER_PORT, database_path="testing.db", password_function=create_simple_password, should_perform_automatic_login=False):
-        """Test case for managing client and server behavior using mock clients and a mock server"""
+    def __init__(self, server_host=DEFAULT_SERVER_HOST, server_port=DEFAULT_SERVER_PORT, database_path="testing.db", password_function=create_simple_password, should_perform_automatic_login=False, engine=None):
+        """
+            Test case for managing client and server behavior using mock clients and a mock server.
+            If a server engine name is given as the engine, the server uses that engine and communicates with the clients over loopback sockets instead.
+        """
         self.server_host = server_host
-        self.server_port = server_port
-        self.factory = TestingFactory(server_host, server_port)
+        if engine is None:
+            self.factory = TestingFactory(server_host, server_port)
+        else:
+            self.factory = LoopbackTestingFactory(server_host, engine)
         self.clients = {}
         self.password_function = password_function
         self.server = self.factory.create_server(database_path)
+        self.server_port = self.factory.server_port
         self.server.listen_for_socket_events_without_blocking()
         self.active_clients = {}
         self.database_path = database_path